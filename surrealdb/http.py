@@ -15,14 +15,252 @@ limitations under the License.
 """
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
-from dataclasses import dataclass
+import re
+import time
+from dataclasses import asdict, dataclass, is_dataclass
+from decimal import Decimal
 from types import TracebackType
-from typing import Any, Dict, List, Optional, Type
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 import httpx
 
-__all__ = ("SurrealHTTP",)
+try:
+    import orjson
+
+    HAS_ORJSON = True
+    # Match the standard library in accepting int, float, bool and None
+    # keys, and serialize numpy arrays natively.
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+except ImportError:  # pragma: no cover - orjson is an optional extra
+    HAS_ORJSON = False
+
+try:
+    import ijson
+
+    HAS_IJSON = True
+except ImportError:  # pragma: no cover - ijson is an optional extra
+    HAS_IJSON = False
+
+__all__ = ("Batch", "SurrealHTTP", "Table")
+
+# Default size above which responses are parsed incrementally when ijson is
+# installed.
+STREAM_THRESHOLD = 1024 * 1024
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Marks a request without a JSON body, as ``None`` is itself serialized.
+_NO_BODY: Any = object()
+
+# Upper bound on the number of responses kept by the opt-in read cache.
+READ_CACHE_MAXSIZE = 1024
+
+
+# ------------------------------------------------------------------------
+# JSON
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize dataclasses for the standard library encoder, as orjson does."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON.
+
+    Uses orjson when installed, falling back to the standard library for
+    input orjson rejects, such as integers wider than 64 bits. Besides the
+    JSON types, dataclass instances and non-string dict keys are accepted,
+    as are numpy arrays when orjson is installed.
+
+    With orjson, ``nan`` and ``inf`` floats are written as ``null`` where
+    the standard library writes the non-standard ``NaN`` and ``Infinity``.
+
+    Args:
+        obj: The object to serialize.
+
+    Returns:
+        The JSON document as bytes.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, default=_json_default).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    """Deserialize a UTF-8 encoded JSON document.
+
+    Uses orjson when installed, falling back to the standard library for
+    documents orjson rejects, such as numbers out of the range of a double.
+
+    With orjson, integers outside the range of a signed or unsigned 64-bit
+    integer are returned as floats, where the standard library keeps them
+    exact.
+
+    Args:
+        data: The raw JSON document.
+
+    Returns:
+        The deserialized object.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+# The integer range orjson parses exactly; wider integers become floats.
+_ORJSON_INT_MIN = -(2**63)
+_ORJSON_INT_MAX = 2**64 - 1
+
+
+def _starts_array(chunks: List[bytes]) -> bool:
+    """Check whether the first non-whitespace byte of a body opens an array."""
+    for chunk in chunks:
+        stripped = chunk.lstrip()
+        if stripped:
+            return stripped[:1] == b"["
+    return False
+
+
+def _match_json_loads(value: Any) -> Any:
+    """Convert numbers parsed by ijson to the types ``_json_loads`` returns.
+
+    ijson yields exact integers and ``Decimal`` for other numbers. Those are
+    turned into floats, as are integers orjson would not parse exactly.
+    Containers are updated in place.
+    """
+    if isinstance(value, dict):
+        for key, item in value.items():
+            value[key] = _match_json_loads(item)
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            value[index] = _match_json_loads(item)
+    elif isinstance(value, Decimal):
+        return float(value)
+    elif (
+        HAS_ORJSON
+        and type(value) is int
+        and not _ORJSON_INT_MIN <= value <= _ORJSON_INT_MAX
+    ):
+        return float(value)
+    return value
+
+
+async def _parse_incrementally(
+    buffered: List[bytes], chunks: AsyncIterator[bytes]
+) -> List[Any]:
+    """Parse a JSON array of statements as its chunks arrive.
+
+    Requires ijson. Parsing holds the GIL, so control is handed back to
+    the event loop between chunks to let other tasks run. Numbers are
+    returned, and invalid documents rejected, as ``_json_loads`` would
+    for the same document.
+
+    Args:
+        buffered: Chunks already read from the body.
+        chunks: The remaining chunks of the body.
+
+    Returns:
+        The deserialized statements.
+
+    Raises:
+        json.JSONDecodeError: The body is not a valid JSON document.
+    """
+    statements = ijson.sendable_list()
+    parser = ijson.items_coro(statements, "item")
+    received = 0
+    try:
+        for chunk in buffered:
+            received += len(chunk)
+            parser.send(chunk)
+        buffered.clear()
+        async for chunk in chunks:
+            received += len(chunk)
+            parser.send(chunk)
+            await asyncio.sleep(0)
+        parser.close()
+    except ijson.JSONError as exc:
+        # The raw body is not kept, so only the number of bytes received
+        # when the error was detected can be reported.
+        raise json.JSONDecodeError(str(exc), "", received) from exc
+    return _match_json_loads(list(statements))
+
+
+# ------------------------------------------------------------------------
+# URLs
+
+
+def _split_thing(thing: str) -> Tuple[str, Optional[str]]:
+    """Split a table name or record ID into its table and record parts.
+
+    Args:
+        thing: The table name or record ID, e.g. ``person:tobie``.
+
+    Returns:
+        The table name and the record ID, or ``None`` for a bare table.
+    """
+    table, sep, record_id = thing.partition(":")
+    return (table, record_id) if sep else (thing, None)
+
+
+# Record IDs the key endpoint parses as SurrealQL integers.
+_INTEGER_ID = re.compile(r"-?[0-9]+")
+_INTEGER_ID_MIN = -(2**63)
+_INTEGER_ID_MAX = 2**63 - 1
+
+
+def _integer_id(record_id: str) -> Optional[int]:
+    """Get the integer a record ID names, or None if it is not one.
+
+    Args:
+        record_id: The record part of a record ID, e.g. ``1`` or ``tobie``.
+
+    Returns:
+        The integer, or ``None`` for any other record ID.
+    """
+    if _INTEGER_ID.fullmatch(record_id):
+        value = int(record_id)
+        if _INTEGER_ID_MIN <= value <= _INTEGER_ID_MAX:
+            return value
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _key_url(url: str, table: str, record_id: Optional[str]) -> str:
+    """Build the URL of the key endpoint for a table or record.
+
+    Args:
+        url: The URL of the SurrealDB server.
+        table: The table name.
+        record_id: The record ID, if addressing a single record.
+
+    Returns:
+        The full URL of the key endpoint.
+    """
+    if record_id:
+        return f"{url}/key/{table}/{record_id}"
+    return f"{url}/key/{table}"
 
 
 class SurrealException(Exception):
@@ -51,12 +289,56 @@ class SurrealResponse:
 class SurrealHTTP:
     """Represents a http connection to a SurrealDB server.
 
+    A single persistent ``httpx.AsyncClient`` is used for every request so
+    that keep-alive connections are reused instead of paying a TCP and TLS
+    handshake per call. Applications talking to several namespaces or
+    databases should create one client and share it between ``SurrealHTTP``
+    instances through the ``client`` argument. The pool and protocol
+    options below only apply to a client created by ``SurrealHTTP``; a
+    shared client keeps its own configuration.
+
+    Under high concurrency the cost of many small requests is dominated by
+    the event loop itself. Running on uvloop (see ``install_uvloop``)
+    substantially improves ``query`` and ``select`` throughput there.
+
     Args:
         url: The URL of the SurrealDB server.
         namespace: The namespace to use for the connection.
         database: The database to use for the connection.
         username: The username to use for the connection.
         password: The password to use for the connection.
+        client: An existing http client to share. It is not closed by
+            ``close``; its owner is responsible for that.
+        max_connections: The maximum number of concurrent connections.
+            Ignored when ``client`` is given; the shared client's own
+            limits apply instead.
+        max_keepalive_connections: The maximum number of idle connections
+            kept alive in the pool.
+        keepalive_expiry: Seconds an idle connection is kept in the pool.
+        read_cache_ttl: Seconds a ``select`` response is reused by later
+            identical calls. Disabled by default. Any write through this
+            instance clears the cache. Cached results are shared between
+            callers and must not be mutated.
+        stream_threshold: Size in bytes above which ``query`` and ``select``
+            responses are parsed incrementally. Requires the ijson extra.
+        http2: Multiplex concurrent requests over a single HTTP/2
+            connection. Requires the http2 extra: without it, an
+            ``ImportError`` is raised here. HTTP/1.1 is still used for
+            plain ``http`` endpoints and servers that do not negotiate
+            HTTP/2 over TLS. Ignored when ``client`` is given. Only worth
+            enabling for highly concurrent workloads, as HTTP/1.1 is
+            faster for sequential small requests.
+        max_concurrency: The maximum number of requests ``select_many`` and
+            ``delete_many`` keep in flight at once, across all of their
+            concurrent calls on this instance. Defaults to
+            ``max_connections``; set it to the pool size of a shared
+            ``client``.
+
+    Examples:
+        Share one connection pool between two databases
+            async with httpx.AsyncClient() as client:
+                users = SurrealHTTP(url, "app", "users", "root", "root", client=client)
+                logs = SurrealHTTP(url, "app", "logs", "root", "root", client=client)
     """
 
     def __init__(
@@ -66,27 +348,98 @@ class SurrealHTTP:
         database: str,
         username: str,
         password: str,
+        client: Optional[httpx.AsyncClient] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 32,
+        keepalive_expiry: float = 30.0,
+        read_cache_ttl: Optional[float] = None,
+        stream_threshold: int = STREAM_THRESHOLD,
+        http2: bool = False,
+        max_concurrency: Optional[int] = None,
     ) -> None:
-        self._url = url
+        # Endpoint paths are appended to the URL, so a trailing slash would
+        # produce paths such as //sql.
+        self._url = url.rstrip("/")
         self._namespace = namespace
         self._database = database
         self._username = username
         self._password = password
-
-        self._http = httpx.AsyncClient(
-            base_url=self._url,
-            auth=httpx.BasicAuth(
-                username=self._username,
-                password=self._password,
-            ),
-            headers={
+        self._max_concurrency = (
+            max_connections if max_concurrency is None else max_concurrency
+        )
+        # Created on first use so that it belongs to the running event loop.
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._stream_threshold = stream_threshold
+
+        self._signup_url = self._url + "/signup"
+        self._signin_url = self._url + "/signin"
+        self._sql_url = self._url + "/sql"
+
+        # Connection details never change, so the headers and auth are
+        # built once. An owned client carries them as its defaults; a
+        # shared client gets them attached to every request instead. They
+        # are normalized into httpx.Headers up front so that merging them
+        # into a request copies the encoded list rather than re-encoding.
+        headers = httpx.Headers(
+            {
                 "NS": self._namespace,
                 "DB": self._database,
                 "Accept": "application/json",
                 "Content-Type": "application/json",
-            },
+            }
+        )
+        auth = httpx.BasicAuth(
+            username=self._username,
+            password=self._password,
         )
 
+        self._owns_client = client is None
+        if client is None:
+            client = httpx.AsyncClient(
+                auth=auth,
+                headers=headers,
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                    keepalive_expiry=keepalive_expiry,
+                ),
+            )
+            self._headers: Optional[httpx.Headers] = None
+            self._auth: Any = httpx.USE_CLIENT_DEFAULT
+        else:
+            self._headers = headers
+            self._auth = auth
+        self._http = client
+
+        # Identical concurrent reads share one request; see _request_deduplicated.
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._read_cache_ttl = read_cache_ttl
+        self._read_cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+        self._read_cache_generation = 0
+
+    @staticmethod
+    def install_uvloop() -> bool:
+        """Make uvloop the event loop for subsequently created loops.
+
+        Must be called before the event loop is started, e.g. before
+        ``asyncio.run``. Does nothing when the uvloop extra is not
+        installed.
+
+        Returns:
+            Whether uvloop was installed.
+
+        Examples:
+            SurrealHTTP.install_uvloop()
+            asyncio.run(main())
+        """
+        try:
+            import uvloop
+        except ImportError:
+            return False
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        return True
+
     async def __aenter__(self) -> SurrealHTTP:
         """Connect to the http client when entering the context manager."""
         await self.connect()
@@ -103,27 +456,249 @@ class SurrealHTTP:
 
     async def connect(self) -> None:
         """Connect to a local or remote database endpoint."""
-        await self._http.__aenter__()
+        if self._owns_client:
+            await self._http.__aenter__()
 
     async def close(self) -> None:
         """Close the persistent connection to the database."""
-        await self._http.aclose()
+        if self._owns_client:
+            await self._http.aclose()
 
-    async def _request(
+    async def _send(
         self,
         method: str,
-        uri: str,
-        data: Optional[str] = None,
+        url: str,
+        data: Optional[Union[str, bytes]] = None,
         params: Optional[Any] = None,
-    ) -> SurrealResponse:
-        surreal_response = await self._http.request(
+    ) -> httpx.Response:
+        """Send a request and return the response with its body unread.
+
+        Every request goes through here. The caller must close the
+        response, which returns its connection to the pool.
+        """
+        request = self._http.build_request(
             method=method,
-            url=uri,
+            url=url,
             content=data,
             params=params,
+            headers=self._headers,
+        )
+        return await self._http.send(request, auth=self._auth, stream=True)
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Union[str, bytes]] = None,
+        params: Optional[Any] = None,
+        json_body: Any = _NO_BODY,
+    ) -> SurrealResponse:
+        if json_body is not _NO_BODY:
+            data = _json_dumps(json_body)
+        surreal_response = await self._send(method, url, data, params)
+        try:
+            surreal_data = await surreal_response.aread()
+        finally:
+            await surreal_response.aclose()
+        # The connection is back in the pool before the body is parsed.
+        return _json_loads(surreal_data)
+
+    async def _request_streaming(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Union[str, bytes]] = None,
+        params: Optional[Any] = None,
+    ) -> SurrealResponse:
+        """Send a request whose response may be large.
+
+        Bodies up to ``stream_threshold`` decoded bytes are parsed in one
+        go. Larger bodies holding an array of statements, including chunked
+        bodies that grow past the threshold, are parsed statement by
+        statement as chunks arrive, so the raw body is never buffered in
+        full and the event loop runs between chunks. Anything else, such as
+        an error object, is parsed in one go regardless of its size.
+        """
+        surreal_response = await self._send(method, url, data, params)
+        try:
+            headers = surreal_response.headers
+            content_length = headers.get("Content-Length")
+            # Content-Length is the encoded size; it only bounds the decoded
+            # body when the response is not compressed.
+            if not HAS_IJSON or (
+                content_length is not None
+                and headers.get("Content-Encoding", "identity") == "identity"
+                and int(content_length) <= self._stream_threshold
+            ):
+                surreal_data = await surreal_response.aread()
+            else:
+                # Buffer until the body proves to be large, then switch over
+                # to the incremental parser.
+                chunks = surreal_response.aiter_bytes(STREAM_CHUNK_SIZE)
+                buffered: List[bytes] = []
+                size = 0
+                async for chunk in chunks:
+                    buffered.append(chunk)
+                    size += len(chunk)
+                    if size > self._stream_threshold:
+                        if _starts_array(buffered):
+                            return await _parse_incrementally(  # type: ignore
+                                buffered, chunks
+                            )
+                        async for chunk in chunks:
+                            buffered.append(chunk)
+                        break
+                surreal_data = b"".join(buffered)
+        finally:
+            await surreal_response.aclose()
+        # The connection is back in the pool before the body is parsed.
+        return _json_loads(surreal_data)
+
+    async def _request_deduplicated(self, method: str, url: str) -> SurrealResponse:
+        """Send an idempotent request, sharing it between identical callers.
+
+        Concurrent callers with the same method and URL await a single
+        request. When ``read_cache_ttl`` is set the response is also
+        returned to later callers until it expires.
+        """
+        key = (method, url)
+        if self._read_cache_ttl is not None:
+            cached = self._read_cache.get(key)
+            if cached is not None:
+                if cached[0] > time.monotonic():
+                    return cached[1]
+                del self._read_cache[key]
+
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._request_streaming(method, url))
+            self._inflight[key] = future
+            future.add_done_callback(
+                functools.partial(self._request_done, key, self._read_cache_generation)
+            )
+        # Shielded so that one cancelled caller does not cancel the others.
+        return await asyncio.shield(future)
+
+    def _request_done(
+        self, key: Tuple[str, str], generation: int, future: asyncio.Future
+    ) -> None:
+        """Forget a finished shared request and cache its response."""
+        # A write may already have detached this request from _inflight.
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if future.cancelled() or future.exception() is not None:
+            return
+        # Do not cache a response that may predate a write.
+        if (
+            self._read_cache_ttl is not None
+            and generation == self._read_cache_generation
+        ):
+            if len(self._read_cache) >= READ_CACHE_MAXSIZE:
+                del self._read_cache[next(iter(self._read_cache))]
+            expires = time.monotonic() + self._read_cache_ttl
+            self._read_cache[key] = (expires, future.result())
+
+    async def _request_key(
+        self,
+        method: str,
+        table: str,
+        record_id: Optional[str],
+        url: Optional[str] = None,
+        json_body: Any = _NO_BODY,
+        check_found: bool = False,
+    ) -> SurrealResponse:
+        """Send a request to the key endpoint of a table or record.
+
+        Reads go through the deduplicating path; anything else is treated
+        as a write and invalidates cached reads.
+
+        Args:
+            method: The http method.
+            table: The table name.
+            record_id: The record ID, if addressing a single record.
+            url: The key endpoint URL, if already known.
+            json_body: The request body, serialized to JSON if given.
+            check_found: Raise if a specific record yields no response.
+
+        Returns:
+            The response statements.
+        """
+        if url is None:
+            url = _key_url(self._url, table, record_id)
+        if method == "GET":
+            response = await self._request_deduplicated(method, url)
+        else:
+            self._invalidate_reads()
+            try:
+                response = await self._request(method, url, json_body=json_body)
+            finally:
+                self._invalidate_reads()
+        if check_found and not response and record_id is not None:
+            raise SurrealException(f"Key {record_id} not found in table {table}")
+        return response
+
+    async def _request_result(
+        self,
+        method: str,
+        table: str,
+        record_id: Optional[str],
+        url: Optional[str] = None,
+        json_body: Any = _NO_BODY,
+        check_found: bool = False,
+    ) -> Any:
+        """Send a single-statement key request and return its result.
+
+        Args:
+            method: The http method.
+            table: The table name.
+            record_id: The record ID, if addressing a single record.
+            url: The key endpoint URL, if already known.
+            json_body: The request body, serialized to JSON if given.
+            check_found: Raise if a specific record yields no response.
+
+        Returns:
+            The result of the first statement.
+        """
+        response = await self._request_key(
+            method,
+            table,
+            record_id,
+            url=url,
+            json_body=json_body,
+            check_found=check_found,
         )
-        surreal_data = await surreal_response.aread()
-        return json.loads(surreal_data)
+        results: Any = response
+        if isinstance(results, dict):
+            # The request was rejected as a whole, e.g. a parse error.
+            raise SurrealException(results.get("information", results))
+        return results[0]["result"]
+
+    async def _gather_bounded(self, coros: Iterable[Awaitable[Any]]) -> List[Any]:
+        """Run awaitables concurrently, at most max_concurrency at a time.
+
+        The bound is shared by every call on this instance, so concurrent
+        batches together never exceed it.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        semaphore = self._semaphore
+
+        async def run(coro: Awaitable[Any]) -> Any:
+            async with semaphore:
+                return await coro
+
+        return await asyncio.gather(*(run(coro) for coro in coros))
+
+    def _invalidate_reads(self) -> None:
+        """Drop cached and in-flight reads around a request that may write.
+
+        Called both before a write is sent and after it completes, so that
+        no read issued before the write finished is reused afterwards,
+        whether from the cache or by joining an in-flight request.
+        """
+        self._read_cache_generation += 1
+        self._read_cache.clear()
+        self._inflight.clear()
 
     # TODO add missing methods - currently undocumented
     # Missing method - wait
@@ -145,7 +720,7 @@ class SurrealHTTP:
             await db.signup({"user": "bob", "pass": "123456"})
         """
         response = await self._request(
-            method="POST", uri="/signup", data=json.dumps(vars)
+            method="POST", url=self._signup_url, data=_json_dumps(vars)
         )
         return response  # type: ignore
 
@@ -159,7 +734,7 @@ class SurrealHTTP:
             await db.signin({"user": "root", "pass": "root"})
         """
         response = await self._request(
-            method="POST", uri="/signin", data=json.dumps(vars)
+            method="POST", url=self._signin_url, data=_json_dumps(vars)
         )
         return response  # type: ignore
 
@@ -185,7 +760,13 @@ class SurrealHTTP:
             Get all of the results from the second query
                 result[1]['result']
         """
-        response = await self._request(method="POST", uri="/sql", data=sql, params=vars)
+        self._invalidate_reads()
+        try:
+            response = await self._request_streaming(
+                method="POST", url=self._sql_url, data=sql.encode("utf-8"), params=vars
+            )
+        finally:
+            self._invalidate_reads()
         return response  # type: ignore
 
     async def select(self, thing: str) -> List[Dict[str, Any]]:
@@ -201,6 +782,9 @@ class SurrealHTTP:
         Returns:
             The records.
 
+        Concurrent identical calls share a single request and receive the
+        same result objects, so copy a result before mutating it.
+
         Examples:
             Select all records from a table (or other entity)
                 people = await db.select('person')
@@ -208,14 +792,8 @@ class SurrealHTTP:
             Select a specific record from a table (or other entity)
                 person = await db.select('person:h5wxrf2ewk8xjxosxtyc')
         """
-        table, record_id = thing.split(":") if ":" in thing else (thing, None)
-        response = await self._request(
-            method="GET",
-            uri=f"/key/{table}/{record_id}" if record_id else f"/key/{table}",
-        )
-        if not response and record_id is not None:
-            raise SurrealException(f"Key {record_id} not found in table {table}")
-        return response[0]["result"]  # type: ignore
+        table, record_id = _split_thing(thing)
+        return await self._request_result("GET", table, record_id, check_found=True)
 
     async def create(self, thing: str, data: Optional[Dict[str, Any]] = None) -> str:
         """Create a record in the database.
@@ -240,15 +818,10 @@ class SurrealHTTP:
                         },
                 })
         """
-        table, record_id = thing.split(":") if ":" in thing else (thing, None)
-        response = await self._request(
-            method="POST",
-            uri=f"/key/{table}/{record_id}" if record_id else f"/key/{table}",
-            data=json.dumps(data, ensure_ascii=False),
+        table, record_id = _split_thing(thing)
+        return await self._request_result(
+            "POST", table, record_id, json_body=data, check_found=True
         )
-        if not response and record_id is not None:
-            raise SurrealException(f"Key {record_id} not found in table {table}")
-        return response[0]["result"]  # type: ignore
 
     async def update(self, thing: str, data: Any) -> Dict[str, Any]:
         """Update all records in a table, or a specific record, in the database.
@@ -276,13 +849,8 @@ class SurrealHTTP:
                         },
                 })
         """
-        table, record_id = thing.split(":") if ":" in thing else (thing, None)
-        response = await self._request(
-            method="PUT",
-            uri=f"/key/{table}/{record_id}" if record_id else f"/key/{table}",
-            data=json.dumps(data, ensure_ascii=False),
-        )
-        return response[0]["result"]  # type: ignore
+        table, record_id = _split_thing(thing)
+        return await self._request_result("PUT", table, record_id, json_body=data)
 
     async def patch(self, thing: str, data: Any) -> Dict[str, Any]:
         """Apply JSON Patch changes to all records, or a specific record, in the database.
@@ -309,13 +877,8 @@ class SurrealHTTP:
                 { 'op': "remove", "path": "/temp" },
             ])
         """
-        table, record_id = thing.split(":") if ":" in thing else (thing, None)
-        response = await self._request(
-            method="PATCH",
-            uri=f"/key/{table}/{record_id}" if record_id else f"/key/{table}",
-            data=json.dumps(data, ensure_ascii=False),
-        )
-        return response[0]["result"]  # type: ignore
+        table, record_id = _split_thing(thing)
+        return await self._request_result("PATCH", table, record_id, json_body=data)
 
     async def delete(self, thing: str) -> List[Dict[str, Any]]:
         """Delete all records in a table, or a specific record, from the database.
@@ -332,9 +895,383 @@ class SurrealHTTP:
             Delete a specific record from a table
                 await db.delete('person:h5wxrf2ewk8xjxosxtyc')
         """
-        table, record_id = thing.split(":") if ":" in thing else (thing, None)
-        response = await self._request(
-            method="DELETE",
-            uri=f"/key/{table}/{record_id}" if record_id else f"/key/{table}",
+        table, record_id = _split_thing(thing)
+        response = await self._request_key("DELETE", table, record_id)
+        return response  # type: ignore
+
+    async def select_many(self, things: Iterable[str]) -> List[List[Dict[str, Any]]]:
+        """Select several tables or records concurrently.
+
+        The requests are sent in parallel over the connection pool, so the
+        batch takes roughly as long as its slowest request. At most
+        ``max_concurrency`` requests are in flight at once, shared with any
+        other ``select_many`` or ``delete_many`` call on this instance.
+
+        Args:
+            things: The tables or record IDs to select.
+
+        Returns:
+            The records for each entry of ``things``, in the same order.
+
+        Examples:
+            people = await db.select_many(['person:tobie', 'person:jaime'])
+        """
+        return await self._gather_bounded(self.select(thing) for thing in things)
+
+    async def delete_many(self, things: Iterable[str]) -> List[List[Dict[str, Any]]]:
+        """Delete several tables or records concurrently.
+
+        The requests are sent in parallel over the connection pool. At most
+        ``max_concurrency`` requests are in flight at once, shared with any
+        other ``select_many`` or ``delete_many`` call on this instance.
+
+        Args:
+            things: The tables or record IDs to delete.
+
+        Returns:
+            The response for each entry of ``things``, in the same order.
+
+        Examples:
+            await db.delete_many(['person:tobie', 'person:jaime'])
+        """
+        return await self._gather_bounded(self.delete(thing) for thing in things)
+
+    def table(self, name: str) -> Table:
+        """Get a handle for running requests against a single table.
+
+        Args:
+            name: The table name.
+
+        Returns:
+            The table handle.
+
+        Examples:
+            people = db.table('person')
+            person = await people.select('tobie')
+        """
+        return Table(self, name)
+
+    def batch(self) -> Batch:
+        """Collect operations and send them as a single SurrealQL request.
+
+        Operations queued on the batch are not sent until the ``async with``
+        block exits, when they are posted together to the /sql endpoint so
+        that N operations cost one round trip.
+
+        Returns:
+            The batch, to be used as an async context manager.
+
+        Examples:
+            async with db.batch() as batch:
+                tobie = batch.create('person:tobie', {'name': 'Tobie'})
+                people = batch.select('person')
+            print(await tobie, await people)
+        """
+        return Batch(self)
+
+
+class Table:
+    """Represents a single table of a SurrealDB server reached over http.
+
+    The key endpoint URL of the table is built once, so addressing one of
+    its records only appends the record ID. Obtain instances through
+    ``SurrealHTTP.table``.
+
+    Args:
+        http: The connection to send requests through.
+        name: The table name.
+
+    Examples:
+        people = db.table('person')
+        await people.create('tobie', {'name': 'Tobie'})
+        person = await people.select('tobie')
+        await people.delete()
+    """
+
+    def __init__(self, http: SurrealHTTP, name: str) -> None:
+        self._http = http
+        self._name = name
+        self._key_prefix = f"{http._url}/key/{name}"
+        self._key_prefix_slash = self._key_prefix + "/"
+
+    @property
+    def name(self) -> str:
+        """The table name."""
+        return self._name
+
+    def _key_url(self, record_id: Optional[str]) -> str:
+        if record_id:
+            return self._key_prefix_slash + record_id
+        return self._key_prefix
+
+    async def select(self, record_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Select all records in the table, or a specific record.
+
+        Concurrent identical calls share a single request and receive the
+        same result objects, so copy a result before mutating it.
+
+        Args:
+            record_id: The record ID to select, or None for all records.
+
+        Returns:
+            The records.
+        """
+        return await self._http._request_result(
+            "GET",
+            self._name,
+            record_id,
+            url=self._key_url(record_id),
+            check_found=True,
+        )
+
+    async def create(
+        self, record_id: Optional[str] = None, data: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Create a record in the table.
+
+        Args:
+            record_id: The record ID, or None for a random ID.
+            data: The document / record data to insert.
+
+        Returns:
+            The created records.
+        """
+        return await self._http._request_result(
+            "POST",
+            self._name,
+            record_id,
+            url=self._key_url(record_id),
+            json_body=data,
+            check_found=True,
+        )
+
+    async def update(self, record_id: Optional[str], data: Any) -> Dict[str, Any]:
+        """Replace all records in the table, or a specific record.
+
+        Args:
+            record_id: The record ID, or None for all records.
+            data: The document / record data to insert.
+
+        Returns:
+            The updated records.
+        """
+        return await self._http._request_result(
+            "PUT",
+            self._name,
+            record_id,
+            url=self._key_url(record_id),
+            json_body=data,
+        )
+
+    async def patch(self, record_id: Optional[str], data: Any) -> Dict[str, Any]:
+        """Apply JSON Patch changes to all records, or a specific record.
+
+        Args:
+            record_id: The record ID, or None for all records.
+            data: The data to modify the record with.
+
+        Returns:
+            The patched records.
+        """
+        return await self._http._request_result(
+            "PATCH",
+            self._name,
+            record_id,
+            url=self._key_url(record_id),
+            json_body=data,
+        )
+
+    async def delete(self, record_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Delete all records in the table, or a specific record.
+
+        Args:
+            record_id: The record ID, or None for all records.
+        """
+        response = await self._http._request_key(
+            "DELETE", self._name, record_id, url=self._key_url(record_id)
         )
         return response  # type: ignore
+
+
+class Batch:
+    """Represents a set of operations sent as one SurrealQL request.
+
+    Each operation is added as a statement and returns a future resolving
+    to that statement's result once the batch has been sent. Table names
+    and record IDs are passed as query variables; record data is inlined
+    as a JSON literal, as http query variables can only carry strings.
+    Integer record IDs such as ``person:1`` are inlined as numbers, so
+    they address the same numeric records as the key endpoint. Any other
+    record ID is sent as a string; use ``query`` for array or object IDs.
+    Obtain instances through ``SurrealHTTP.batch``.
+
+    Args:
+        http: The connection to send the batch through.
+    """
+
+    def __init__(self, http: SurrealHTTP) -> None:
+        self._http = http
+        self._statements: List[str] = []
+        self._vars: Dict[str, str] = {}
+        self._futures: List[asyncio.Future] = []
+
+    async def __aenter__(self) -> Batch:
+        """Start collecting operations."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]] = None,
+        exc_value: Optional[BaseException] = None,
+        traceback: Optional[TracebackType] = None,
+    ) -> None:
+        """Send the collected operations, unless the block raised."""
+        if exc_type is not None:
+            for future in self._futures:
+                future.cancel()
+            self._statements, self._vars, self._futures = [], {}, []
+            return
+        await self.send()
+
+    def _target(self, thing: str) -> str:
+        """Add the variables addressing a table or record to the batch."""
+        table, record_id = _split_thing(thing)
+        index = len(self._statements)
+        self._vars[f"tb{index}"] = table
+        if record_id is None:
+            return f"type::table($tb{index})"
+        integer = _integer_id(record_id)
+        if integer is not None:
+            return f"type::thing($tb{index}, {integer})"
+        self._vars[f"id{index}"] = record_id
+        return f"type::thing($tb{index}, $id{index})"
+
+    def _add(self, statement: str) -> asyncio.Future:
+        self._statements.append(statement)
+        future = asyncio.get_running_loop().create_future()
+        self._futures.append(future)
+        return future
+
+    def select(self, thing: str) -> asyncio.Future:
+        """Queue a select of all records in a table, or a specific record.
+
+        Args:
+            thing: The table or record ID to select.
+
+        Returns:
+            A future resolving to the records.
+        """
+        return self._add(f"SELECT * FROM {self._target(thing)}")
+
+    def create(
+        self, thing: str, data: Optional[Dict[str, Any]] = None
+    ) -> asyncio.Future:
+        """Queue the creation of a record.
+
+        Args:
+            thing: The table or record ID.
+            data: The document / record data to insert.
+
+        Returns:
+            A future resolving to the statement's result, the list of
+            created records.
+        """
+        statement = f"CREATE {self._target(thing)}"
+        if data is not None:
+            statement += f" CONTENT {_json_dumps(data).decode('utf-8')}"
+        return self._add(statement)
+
+    def update(self, thing: str, data: Any) -> asyncio.Future:
+        """Queue the replacement of all records in a table, or a specific record.
+
+        Args:
+            thing: The table or record ID.
+            data: The document / record data to insert.
+
+        Returns:
+            A future resolving to the updated records.
+        """
+        content = _json_dumps(data).decode("utf-8")
+        return self._add(f"UPDATE {self._target(thing)} CONTENT {content}")
+
+    def patch(self, thing: str, data: Any) -> asyncio.Future:
+        """Queue JSON Patch changes to all records, or a specific record.
+
+        Args:
+            thing: The table or record ID.
+            data: The data to modify the record with.
+
+        Returns:
+            A future resolving to the patched records.
+        """
+        content = _json_dumps(data).decode("utf-8")
+        return self._add(f"UPDATE {self._target(thing)} PATCH {content}")
+
+    def delete(self, thing: str) -> asyncio.Future:
+        """Queue the deletion of all records in a table, or a specific record.
+
+        Args:
+            thing: The table name or a record ID to delete.
+
+        Returns:
+            A future resolving to the result of the deletion.
+        """
+        return self._add(f"DELETE {self._target(thing)}")
+
+    async def send(self) -> None:
+        """Send the queued operations and resolve their futures.
+
+        Called automatically when the ``async with`` block exits. Each
+        statement that failed resolves its future with a
+        ``SurrealException``, which is not reported if the future is never
+        awaited. If the request fails, or the server rejects it as a whole,
+        the error is raised from ``send`` and every future is cancelled.
+
+        Raises:
+            SurrealException: The server rejected the batch, e.g. because
+                a statement could not be parsed.
+        """
+        if not self._statements:
+            return
+        statements, self._statements = self._statements, []
+        futures, self._futures = self._futures, []
+        variables, self._vars = self._vars, {}
+
+        self._http._invalidate_reads()
+        try:
+            response = await self._http._request(
+                method="POST",
+                url=self._http._sql_url,
+                data=";\n".join(statements).encode("utf-8"),
+                params=variables,
+            )
+        except BaseException:
+            # The error propagates from send itself; cancelling rather than
+            # failing the futures keeps unawaited ones from being reported.
+            for future in futures:
+                future.cancel()
+            raise
+        finally:
+            self._http._invalidate_reads()
+
+        results: Any = response
+        if not isinstance(results, list):
+            # The request as a whole was rejected, e.g. a parse error.
+            for future in futures:
+                future.cancel()
+            raise SurrealException(results.get("information", results))
+        for index, future in enumerate(futures):
+            if future.cancelled():
+                continue
+            if index >= len(results):
+                error = SurrealException(f"No result for batch statement {index}")
+            elif results[index].get("status") != "OK":
+                detail = results[index].get("detail", results[index].get("result"))
+                error = SurrealException(detail)
+            else:
+                future.set_result(results[index]["result"])
+                continue
+            future.set_exception(error)
+            # Callers may ignore the futures of statements they do not need;
+            # retrieving the exception once keeps asyncio from logging it.
+            future.exception()
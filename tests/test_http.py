@@ -0,0 +1,326 @@
+"""Tests for the concurrent request handling of SurrealHTTP."""
+import asyncio
+import gc
+import json
+from typing import Any, List, Optional
+
+import httpx
+import pytest
+
+from surrealdb.http import SurrealException, SurrealHTTP
+
+
+class FakeServer:
+    """Serves a single record, optionally holding requests until released."""
+
+    def __init__(self) -> None:
+        self.value = 1
+        self.gets = 0
+        self.puts = 0
+        self.hold_get: Optional[asyncio.Event] = None
+        self.hold_put: Optional[asyncio.Event] = None
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        """Answer a GET with the record and a PUT by replacing it."""
+        if request.method == "GET":
+            self.gets += 1
+            value = self.value
+            if self.hold_get is not None:
+                event, self.hold_get = self.hold_get, None
+                await event.wait()
+            return self._respond(value)
+        self.puts += 1
+        if self.hold_put is not None:
+            event, self.hold_put = self.hold_put, None
+            await event.wait()
+        self.value = json.loads(request.content)["v"]
+        return self._respond(self.value)
+
+    @staticmethod
+    def _respond(value: int) -> httpx.Response:
+        body = [{"time": "1ms", "status": "OK", "result": [{"v": value}]}]
+        return httpx.Response(200, content=json.dumps(body).encode())
+
+
+def _connect(server: FakeServer, **kwargs: Any) -> SurrealHTTP:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(server.handler))
+    return SurrealHTTP(
+        "http://surreal", "test", "test", "root", "root", client=client, **kwargs
+    )
+
+
+async def _until(condition: Any) -> None:
+    while not condition():
+        await asyncio.sleep(0)
+
+
+def _run(scenario: Any) -> None:
+    errors: List[Any] = []
+
+    async def main() -> None:
+        asyncio.get_running_loop().set_exception_handler(
+            lambda loop, context: errors.append(context)
+        )
+        await scenario()
+
+    # A broken interleaving deadlocks rather than failing, so bound it.
+    asyncio.run(asyncio.wait_for(main(), timeout=5))
+    assert errors == []
+
+
+def test_concurrent_selects_share_one_request() -> None:
+    """Identical concurrent selects are sent once and share the result."""
+
+    async def scenario() -> None:
+        server = FakeServer()
+        db = _connect(server)
+        first, second = await asyncio.gather(
+            db.select("person:a"), db.select("person:a")
+        )
+        assert first == [{"v": 1}]
+        assert first is second
+        assert server.gets == 1
+        assert db._inflight == {}
+
+    _run(scenario)
+
+
+def test_select_after_write_does_not_join_earlier_read() -> None:
+    """A select after a write does not reuse a read sent before it."""
+
+    async def scenario() -> None:
+        server = FakeServer()
+        release = server.hold_get = asyncio.Event()
+        db = _connect(server)
+
+        stale = asyncio.ensure_future(db.select("person:a"))
+        await _until(lambda: server.gets == 1)
+        await db.update("person:a", {"v": 2})
+
+        assert await db.select("person:a") == [{"v": 2}]
+        assert server.gets == 2
+
+        release.set()
+        assert await stale == [{"v": 1}]
+        assert db._inflight == {}
+
+    _run(scenario)
+
+
+def test_detached_read_does_not_forget_newer_read() -> None:
+    """A read detached by a write does not drop the newer in-flight read."""
+
+    async def scenario() -> None:
+        server = FakeServer()
+        release_stale = server.hold_get = asyncio.Event()
+        db = _connect(server)
+
+        stale = asyncio.ensure_future(db.select("person:a"))
+        await _until(lambda: server.gets == 1)
+        await db.update("person:a", {"v": 2})
+
+        release_fresh = server.hold_get = asyncio.Event()
+        fresh = asyncio.ensure_future(db.select("person:a"))
+        await _until(lambda: server.gets == 2)
+        release_stale.set()
+        await stale
+        assert len(db._inflight) == 1
+
+        release_fresh.set()
+        assert await fresh == [{"v": 2}]
+        assert db._inflight == {}
+
+    _run(scenario)
+
+
+def test_read_during_write_is_not_cached() -> None:
+    """A read racing a write is not served from the cache afterwards."""
+
+    async def scenario() -> None:
+        server = FakeServer()
+        release = server.hold_put = asyncio.Event()
+        db = _connect(server, read_cache_ttl=10)
+
+        write = asyncio.ensure_future(db.update("person:a", {"v": 2}))
+        await _until(lambda: server.puts == 1)
+        assert await db.select("person:a") == [{"v": 1}]
+
+        release.set()
+        await write
+        assert await db.select("person:a") == [{"v": 2}]
+
+    _run(scenario)
+
+
+def test_repeated_select_is_served_from_cache() -> None:
+    """The read cache serves repeats until a write invalidates it."""
+
+    async def scenario() -> None:
+        server = FakeServer()
+        db = _connect(server, read_cache_ttl=10)
+        await db.select("person:a")
+        assert await db.select("person:a") == [{"v": 1}]
+        assert server.gets == 1
+
+        await db.update("person:a", {"v": 2})
+        assert await db.select("person:a") == [{"v": 2}]
+        assert server.gets == 2
+
+    _run(scenario)
+
+
+def test_select_many_calls_share_the_concurrency_bound() -> None:
+    """Concurrent select_many calls together stay within max_concurrency."""
+
+    async def scenario() -> None:
+        active = peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return FakeServer._respond(1)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        db = SurrealHTTP(
+            "http://surreal",
+            "test",
+            "test",
+            "root",
+            "root",
+            client=client,
+            max_concurrency=2,
+        )
+        things = [f"person:{i}" for i in range(4)]
+        await asyncio.gather(db.select_many(things), db.select_many(things[::-1]))
+        assert peak == 2
+
+    _run(scenario)
+
+
+def test_batch_transport_error_cancels_futures() -> None:
+    """A failed batch request raises from send and cancels its futures."""
+
+    async def scenario() -> None:
+        async def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        db = SurrealHTTP(
+            "http://surreal", "test", "test", "root", "root", client=client
+        )
+        with pytest.raises(httpx.ConnectError):
+            async with db.batch() as batch:
+                created = batch.create("person:a", {"v": 1})
+                selected = batch.select("person")
+        assert created.cancelled() and selected.cancelled()
+        # Futures failed with an exception would be reported once collected.
+        del created, selected, batch
+        gc.collect()
+
+    _run(scenario)
+
+
+def test_trailing_slash_in_url_is_ignored() -> None:
+    """Endpoint paths are joined to the URL without doubling the slash."""
+
+    async def scenario() -> None:
+        paths: List[str] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            return FakeServer._respond(1)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        db = SurrealHTTP(
+            "http://surreal/", "test", "test", "root", "root", client=client
+        )
+        await db.query("INFO FOR DB")
+        await db.select("person:a")
+        await db.table("person").select("a")
+        assert paths == ["/sql", "/key/person/a", "/key/person/a"]
+
+    _run(scenario)
+
+
+def test_batch_sends_integer_ids_as_numbers() -> None:
+    """A numeric record ID addresses the same record as the key endpoint."""
+
+    async def scenario() -> None:
+        requests: List[httpx.Request] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            body = [{"time": "1ms", "status": "OK", "result": []}] * 2
+            return httpx.Response(200, content=json.dumps(body).encode())
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        db = SurrealHTTP(
+            "http://surreal", "test", "test", "root", "root", client=client
+        )
+        async with db.batch() as batch:
+            batch.delete("person:1")
+            batch.select("person:tobie")
+
+        statements = requests[0].content.decode().split(";\n")
+        assert statements[0] == "DELETE type::thing($tb0, 1)"
+        assert statements[1] == "SELECT * FROM type::thing($tb1, $id1)"
+        assert dict(requests[0].url.params) == {
+            "tb0": "person",
+            "tb1": "person",
+            "id1": "tobie",
+        }
+
+    _run(scenario)
+
+
+def _batch_server(body: Any) -> SurrealHTTP:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=json.dumps(body).encode())
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return SurrealHTTP("http://surreal", "test", "test", "root", "root", client=client)
+
+
+def test_batch_resolves_each_statement() -> None:
+    """Each future resolves with its own statement's result or error."""
+
+    async def scenario() -> None:
+        db = _batch_server(
+            [
+                {"time": "1ms", "status": "OK", "result": [{"v": 1}]},
+                {"time": "1ms", "status": "ERR", "detail": "Record exists"},
+                {"time": "1ms", "status": "ERR", "detail": "Ignored"},
+            ]
+        )
+        async with db.batch() as batch:
+            created = batch.create("person:a", {"v": 1})
+            failed = batch.create("person:b")
+            ignored = batch.delete("person:c")
+            missing = batch.select("person")
+
+        assert await created == [{"v": 1}]
+        with pytest.raises(SurrealException, match="Record exists"):
+            await failed
+        with pytest.raises(SurrealException, match="No result"):
+            await missing
+        # A failed statement nobody awaits is not reported once collected.
+        del ignored
+        gc.collect()
+
+    _run(scenario)
+
+
+def test_batch_rejected_by_server_raises() -> None:
+    """A batch the server rejects raises from send and cancels its futures."""
+
+    async def scenario() -> None:
+        db = _batch_server({"code": 400, "information": "Parse error"})
+        with pytest.raises(SurrealException, match="Parse error"):
+            async with db.batch() as batch:
+                selected = batch.select("person")
+        assert selected.cancelled()
+
+    _run(scenario)
@@ -0,0 +1,115 @@
+"""Tests for the incremental parsing of large SurrealHTTP responses."""
+import asyncio
+import gzip
+import json
+from typing import Any, AsyncIterator, List
+
+import httpx
+import pytest
+
+from surrealdb import http
+from surrealdb.http import SurrealHTTP, _json_loads
+
+pytest.importorskip("ijson")
+
+THRESHOLD = 1024
+
+RECORD = {
+    "id": "person:tobie",
+    "name": "Tobié",
+    "small": -5,
+    "wide": 2**64 + 1,
+    "ratio": 0.1,
+    "tiny": 1e-7,
+    "whole": 2.0,
+    "flags": [True, False, None],
+    "nested": {"scores": [1, 2.5, -3e20]},
+}
+
+STATEMENTS = json.dumps(
+    [{"time": "1ms", "status": "OK", "result": [RECORD] * 100}] * 3
+).encode()
+
+ERROR = json.dumps(
+    {"code": 400, "details": "Request problems detected", "information": "x" * 4000}
+).encode()
+
+
+def _respond(body: bytes, framing: str) -> httpx.Response:
+    if framing == "gzip":
+        compressed = gzip.compress(body)
+        # Only the decoded size shows that the body is large.
+        assert len(compressed) <= THRESHOLD
+        return httpx.Response(
+            200, headers={"Content-Encoding": "gzip"}, content=compressed
+        )
+    if framing == "chunked":
+
+        async def chunks() -> AsyncIterator[bytes]:
+            for start in range(0, len(body), 100):
+                yield body[start : start + 100]
+
+        return httpx.Response(200, content=chunks())
+    return httpx.Response(200, content=body)
+
+
+def _query(body: bytes, framing: str = "length") -> Any:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return _respond(body, framing)
+
+    async def main() -> Any:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        db = SurrealHTTP(
+            "http://surreal",
+            "test",
+            "test",
+            "root",
+            "root",
+            client=client,
+            stream_threshold=THRESHOLD,
+        )
+        return await db.query("SELECT * FROM person")
+
+    return asyncio.run(main())
+
+
+@pytest.fixture
+def incremental(monkeypatch: pytest.MonkeyPatch) -> List[int]:
+    """Count the responses handed to the incremental parser."""
+    calls: List[int] = []
+    parse = http._parse_incrementally
+
+    async def counting(*args: Any) -> Any:
+        calls.append(1)
+        return await parse(*args)
+
+    monkeypatch.setattr(http, "_parse_incrementally", counting)
+    return calls
+
+
+@pytest.mark.parametrize("framing", ["length", "chunked", "gzip"])
+def test_large_statements_match_buffered_parse(
+    framing: str, incremental: List[int]
+) -> None:
+    """A large array of statements parses as the buffered parser would."""
+    result = _query(STATEMENTS, framing)
+    assert incremental == [1]
+    # repr also tells apart ints and floats that compare equal.
+    assert repr(result) == repr(_json_loads(STATEMENTS))
+
+
+@pytest.mark.parametrize("framing", ["length", "chunked"])
+def test_large_error_object_is_not_streamed(
+    framing: str, incremental: List[int]
+) -> None:
+    """A large top-level error object is returned rather than emptied."""
+    result = _query(ERROR, framing)
+    assert incremental == []
+    assert result == _json_loads(ERROR)
+
+
+@pytest.mark.parametrize("size", [THRESHOLD // 2, len(STATEMENTS) - 1])
+def test_truncated_body_raises_the_same_error(size: int) -> None:
+    """A truncated body raises JSONDecodeError whether or not it streams."""
+    with pytest.raises(json.JSONDecodeError):
+        _query(STATEMENTS[:size], "chunked")